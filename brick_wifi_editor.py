@@ -1,54 +1,59 @@
 import os
+import subprocess
 import sys
 import re
 from tkinter import COMMAND
 
 ORIGINAL_WPA = 'ctrl_interface=DIR=/var/run/wpa_supplicant GROUP=netdev\nupdate_config=1\ncountry=CA\n\nnetwork={\n\tssid="DPM"\n\tpsk="dddpppmmm"\n\tkey_mgmt=WPA-PSK\n}\n'
 
-NETWORK = '''network=[
+NETWORK = '''network={{
     ssid="{}"
     psk="{}"
     key_mgmt=WPA-PSK
-]\n'''
+}}\n'''
 
-NETWORK_PATTERN = r'network=\{\s*ssid="(.+)"\s*psk="(.+)"\s*key_mgmt=WPA-PSK\s*\}'
+NETWORK_PATTERN = rb'network=\{\s*ssid="(.+)"\s*psk="(.+)"\s*key_mgmt=WPA-PSK\s*\}'
+_NETWORK_RE = re.compile(NETWORK_PATTERN)
+
+
+WPA_SUPPLICANT_CONF = '/etc/wpa_supplicant/wpa_supplicant.conf'
 
 
 def reset_autohotspot():
-    os.system("printf '6\n1\nrobots1234\n8\n' | ~/Autohotspot/autohotspot-setup.sh")
+    subprocess.run([os.path.expanduser('~/Autohotspot/autohotspot-setup.sh')],
+                   input=b'6\n1\nrobots1234\n8\n')
 
 
 def reset_wpa():
-    os.system(
-        f"printf '{ORIGINAL_WPA}' | sudo tee /etc/wpa_supplicant/wpa_supplicant.conf")
+    set_wpa(ORIGINAL_WPA)
 
 
 def set_wpa(text):
-    os.system(
-        f"printf '{text}' | sudo tee /etc/wpa_supplicant/wpa_supplicant.conf")
+    # feed the config to sudo tee directly instead of spawning a shell + printf,
+    # which also re-interpreted quotes and escapes in the text
+    if isinstance(text, str):
+        text = text.encode()
+    subprocess.run(['sudo', 'tee', WPA_SUPPLICANT_CONF],
+                   input=text, stdout=subprocess.DEVNULL)
 
 
 def get_wpa():
-    f = open('/etc/wpa_supplicant/wpa_supplicant.conf', 'r')
-    s = f.read()
-    f.close()
-    return s
+    # the config is plain ASCII, so read it as bytes and skip the utf-8 decode
+    with open(WPA_SUPPLICANT_CONF, 'rb') as f:
+        return f.read()
 
 
 def list_wpa():
-    text = get_wpa()
-    ls = re.findall(NETWORK_PATTERN, text)
-    return [ (str(a), str(b)) for a, b in ls ]
+    return [(a.decode(), b.decode()) for a, b in _NETWORK_RE.findall(get_wpa())]
 
 def new_network(ssid, psk):
-    s = NETWORK.format(ssid, psk)
-    s = s.replace('[', '{')
-    s = s.replace(']', '}')
-    return s
+    return NETWORK.format(ssid, psk)
 
 
 def add_network(ssid, psk):
-    set_wpa(get_wpa() + new_network(ssid, psk))
+    # append just the new block instead of reading back and rewriting the whole config
+    subprocess.run(['sudo', 'tee', '-a', WPA_SUPPLICANT_CONF],
+                   input=new_network(ssid, psk).encode(), stdout=subprocess.DEVNULL)
 
 
 COMMAND_OPTIONS = '''
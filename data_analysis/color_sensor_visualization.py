@@ -8,9 +8,7 @@ Before running this script for the first time, you must install the dependencies
 as explained in the README.md file.
 """
 
-from ast import literal_eval
-from math import sqrt, e, pi
-from statistics import mean, stdev
+from math import pi
 
 from matplotlib import pyplot as plt
 import numpy as np
@@ -21,25 +19,23 @@ COLOR_SENSOR_DATA_FILE = "color_sensor.csv"
 
 def gaussian(x, values):
     "Return a gaussian function from the given values."
-    sigma = stdev(values)
-    return (1 / (sigma * sqrt(2 * pi))) * e ** (-((x - mean(values)) ** 2) / (2 * sigma ** 2))
+    sigma = values.std(ddof=1)
+    return np.exp(-((x - values.mean()) ** 2) / (2 * sigma ** 2)) / (sigma * np.sqrt(2 * pi))
 
 
-red, green, blue = [], [], []
-with open(COLOR_SENSOR_DATA_FILE, "r") as f:
-    for line in f.readlines():
-        r, g, b = literal_eval(line)  # convert string to 3 floats
-        # normalize the values to be between 0 and 1
+# each line looks like "(r, g, b)", so strip the parens while parsing the 3 floats
+data = np.loadtxt(COLOR_SENSOR_DATA_FILE, delimiter=",",
+                  converters={0: lambda s: float(s.lstrip("(")),
+                              2: lambda s: float(s.rstrip(")"))})
+# normalize the values to be between 0 and 1
 
-        ### UNIT-VECTOR METHOD ###
-        # denominator = sqrt(r ** 2 + g ** 2 + b ** 2)
+### UNIT-VECTOR METHOD ###
+# normalized = data / np.sqrt((data ** 2).sum(axis=1, keepdims=True))
 
-        ### RATIO METHOD ###
-        denominator = r + g + b
-        
-        red.append(r / denominator)
-        green.append(g / denominator)
-        blue.append(b / denominator)
+### RATIO METHOD ###
+normalized = data / data.sum(axis=1, keepdims=True)
+
+red, green, blue = normalized.T
 
 
 x_values = np.linspace(0, 1, 255)  # 255 evenly spaced values between 0 and 1
@@ -9,18 +9,17 @@ as explained in the README.md file.
 """
 
 from matplotlib import pyplot as plt
+import numpy as np
 
 US_SENSOR_DATA_FILE = "us_sensor.csv"
 DELAY_SEC = 0.01
 
-with open(US_SENSOR_DATA_FILE, "r") as f:
-    distances = [float(d) for d in f.readlines()]
-
-times = [DELAY_SEC * i for i in range(len(distances))]
+distances = np.loadtxt(US_SENSOR_DATA_FILE)
+times = np.arange(distances.size) * DELAY_SEC
 
 # You can customize the plot below, eg, by changing the color
 plt.plot(times, distances)
 plt.xlabel("Time (s)")
 plt.ylabel("Distance (cm)")
-plt.yticks([d for d in range(round(max(distances)) + 10) if d % 10 == 0])
+plt.yticks(np.arange(0, round(distances.max()) + 10, 10))
 plt.show()
@@ -9,30 +9,47 @@ from threading import Thread
 from tkinter import Tk
 from tkinter.ttk import Button
 from types import FunctionType
+import functools
 import json
 import os
+import shlex
+import subprocess
 import sys
 
 
 ENV_FILE = ".env"  # in this folder
 ECSE211_DIR = "/home/pi/ecse211"  # on the brick
 
+# Reuse a single SSH connection for all deploy commands, so only the first one
+# pays for the TCP + SSH handshake. plink uses -share for the same purpose.
+SSH_MULTIPLEX_OPTIONS = ["-o", "ControlMaster=auto",
+                         "-o", "ControlPath=" + os.path.expanduser("~/.ssh/cm-%r@%h:%p"),
+                         "-o", "ControlPersist=60"]
+
 error = lambda text: print(f"\033[91m{text}\033[0m")  # print text in red
 
 
+@functools.lru_cache(maxsize=1)
 def is_raspberry_pi() -> bool:
     "Return True if script is run on Raspberry Pi, False otherwise."
     MODEL_FILE = "/sys/firmware/devicetree/base/model"
     if os.path.isfile(MODEL_FILE):
-        with open(MODEL_FILE) as f:
-            return "raspberry" in f.read().lower()
+        # read as bytes: the device-tree blob is NUL-terminated and not valid utf-8
+        with open(MODEL_FILE, "rb") as f:
+            return b"raspberry" in f.read().lower()
     return False
 
 
+@functools.lru_cache(maxsize=None)
+def _read_json_file(path: str, mtime: float):
+    "Parse the given JSON file once; the mtime key invalidates the cache if the file is edited."
+    with open(path) as f:
+        return json.load(f)
+
+
 def read_project_info():
     "Return the project information from the project_info.json file."
-    with open("project_info.json") as f:
-        return json.load(f)
+    return _read_json_file("project_info.json", os.path.getmtime("project_info.json"))
 
 
 def read_password():
@@ -42,8 +59,7 @@ def read_password():
             f.write('{\n  "password": "ENTER YOUR BRICKPI PASSWORD HERE"\n}\n')  # change the .env file, NOT this line
         error("Robot password not set in .env file! Please enter it there, save the file, and try again.")
         exit(1)
-    with open(ENV_FILE) as f:
-        return json.load(f)["password"]
+    return _read_json_file(ENV_FILE, os.path.getmtime(ENV_FILE))["password"]
 
 
 is_pi = is_raspberry_pi()
@@ -60,17 +76,21 @@ def copy_project_folder_to_brick():
     """
     project_name = os.path.basename(os.getcwd())
     robot_project_path = f"{ECSE211_DIR}/{project_name}"
-    
+
     if is_windows:
-        rm_cmd = f'plink -batch -l pi -pw "{password}" {robot_name} "rm -rf {robot_project_path}"'
-        if command_result(rm_cmd):
-            error("Failed to connect to brick or remove old project. Please ensure the brick is turned on and "
-                  "connected to the same network as this computer.")
-        else:
-            copy_cmd = f'pscp -batch -l pi -pw "{password}" -r {os.getcwd()} pi@{robot_name}:{ECSE211_DIR}'
+        rm_cmd = ["plink", "-batch", "-share", "-l", "pi", "-pw", password, robot_name,
+                  f"rm -rf {shlex.quote(robot_project_path)}"]
+        copy_cmd = ["pscp", "-batch", "-l", "pi", "-pw", password, "-r", os.getcwd(),
+                    f"pi@{robot_name}:{ECSE211_DIR}"]
     else:
-        copy_cmd = f'''sshpass -p "{password}" ssh pi@{robot_name} "rm -rf {robot_project_path
-            }" && sshpass -p "{password}" scp -pr "{os.getcwd()}" pi@{robot_name}:{robot_project_path}'''
+        rm_cmd = ["sshpass", "-p", password, "ssh", *SSH_MULTIPLEX_OPTIONS, f"pi@{robot_name}",
+                  f"rm -rf {shlex.quote(robot_project_path)}"]
+        copy_cmd = ["sshpass", "-p", password, "scp", *SSH_MULTIPLEX_OPTIONS, "-pr", os.getcwd(),
+                    f"pi@{robot_name}:{robot_project_path}"]
+    if command_result(rm_cmd):
+        error("Failed to connect to brick or remove old project. Please ensure the brick is turned on and "
+              "connected to the same network as this computer.")
+        return
     print(f"Copying {project_name} to {robot_name}...")
     if command_result(copy_cmd):
         error("Failed to copy project to brick. Please ensure it is turned on and connected to "
@@ -79,21 +99,19 @@ def copy_project_folder_to_brick():
 
 def run_on_brick(program_path: str, cmd: str):
     "Run a given command on the brick, using the given path as a working directory."
+    remote_cmd = f"cd {program_path} && {cmd}"
     if is_windows:
-        run_cmd = f'plink -batch -l pi -pw "{password}" {robot_name} "cd {program_path} && {cmd}"'
+        run_cmd = ["plink", "-batch", "-share", "-l", "pi", "-pw", password, robot_name, remote_cmd]
     else:
-        run_cmd = f'sshpass -p "{password}" ssh pi@{robot_name} "cd {program_path} && {cmd}"'
-    print(f"Running command on {robot_name}:\n> {run_cmd}".replace(password, 8 * '*'))
+        run_cmd = ["sshpass", "-p", password, "ssh", *SSH_MULTIPLEX_OPTIONS, f"pi@{robot_name}", remote_cmd]
+    print(f"Running command on {robot_name}:\n> {' '.join(run_cmd)}".replace(password, 8 * '*'))
     if command_result(run_cmd):
-        error(f"Failed to run `{run_cmd}` command on brick.")
+        error(f"Failed to run `{remote_cmd}` command on brick.")
 
 
-def command_result(command: str) -> int:
+def command_result(command: list) -> int:
     "Return an integer status code, 0 if successful, non-zero otherwise."
-    if is_windows:  # Windows
-        return os.system(command)
-    else:  # *nix
-        return os.WEXITSTATUS(os.system(command))
+    return subprocess.call(command)
 
 
 def run_main_entry_point():
@@ -117,13 +135,12 @@ def reset_brick():
 
 
 def run_in_background(action: FunctionType) -> FunctionType:
-    "Use to run an action (a function) in the background."
-    return Thread(target=action).start
+    "Use to run an action (a function) in the background, in a fresh thread on every call."
+    return lambda: Thread(target=action, daemon=True).start()
 
 
 class DeployToRobotGUI:
     "Simple window with robot deployment options."
-    DELAY_MS = 100  # delay between button updates in milliseconds
     PAD_X, PAD_Y = 20, 5  # padding between window buttons in pixels
 
     def __init__(self, root: Tk):
@@ -134,14 +151,9 @@ class DeployToRobotGUI:
             Button(root, text="Deploy and run DPM Project on Robot"): deploy_and_run,
             Button(root, text="Reset Robot"): reset_brick,
         }
-        for button in self.button_actions:
-            button.pack(padx=self.PAD_X, pady=self.PAD_Y)
-
-    def update_button_actions(self):
-        "Recursively update button actions to allow them to be spawned repeatedly."
         for button, action in self.button_actions.items():
             button.config(command=run_in_background(action))
-        self.root.after(self.DELAY_MS, self.update_button_actions)
+            button.pack(padx=self.PAD_X, pady=self.PAD_Y)
 
 
 if __name__ == "__main__":
@@ -152,7 +164,7 @@ if __name__ == "__main__":
 
     if len(sys.argv) == 1:  # show GUI when there are no commmand line arguments
         root = Tk()
-        DeployToRobotGUI(root).update_button_actions()
+        DeployToRobotGUI(root)
         root.mainloop()
 
     if "-copy" in sys.argv:
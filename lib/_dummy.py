@@ -1,29 +1,23 @@
+from enum import IntEnum
 from typing import Literal
 
+_STRIP_TBL = str.maketrans('', '', ' ,\t')
 
-class Enumeration(object):
-    def __init__(self, names):  # or *names, with no .split()
-        number = 0
-        for line, name in enumerate(names.split('\n')):
-            if name.find(",") >= 0:
-                # strip out the spaces
-                while(name.find(" ") != -1):
-                    name = name[:name.find(" ")] + name[(name.find(" ") + 1):]
 
-                # strip out the commas
-                while(name.find(",") != -1):
-                    name = name[:name.find(",")] + name[(name.find(",") + 1):]
-
-                # if the value was specified
-                if(name.find("=") != -1):
-                    number = int(float(name[(name.find("=") + 1):]))
-                    name = name[:name.find("=")]
-
-                # optionally print to confirm that it's working correctly
-                # print "%40s has a value of %d" % (name, number)
-
-                setattr(self, name, number)
-                number = number + 1
+def _enum(name, names):
+    """Build an IntEnum from a newline-separated block of "NAME," or "NAME = value," entries."""
+    members = {}
+    number = 0
+    for entry in names.translate(_STRIP_TBL).split('\n'):
+        entry, _, value = entry.partition("=")
+        if not entry:
+            continue
+        # if the value was specified
+        if value:
+            number = int(value, 0)
+        members[entry] = number
+        number = number + 1
+    return IntEnum(name, members)
 
 
 class FirmwareVersionError(Exception):
@@ -52,7 +46,7 @@ class BrickPi3():
 
     I2C_LENGTH_LIMIT = 16
 
-    BPSPI_MESSAGE_TYPE = Enumeration("""
+    BPSPI_MESSAGE_TYPE = _enum("BPSPI_MESSAGE_TYPE", """
         NONE,
 
         GET_MANUFACTURER,
@@ -108,7 +102,7 @@ class BrickPi3():
         GET_MOTOR_D_STATUS,
     """)
 
-    SENSOR_TYPE = Enumeration("""
+    SENSOR_TYPE = _enum("SENSOR_TYPE", """
         NONE = 1,
         I2C,
         CUSTOM,
@@ -147,7 +141,7 @@ class BrickPi3():
         EV3_INFRARED_REMOTE,
     """)
 
-    SENSOR_STATE = Enumeration("""
+    SENSOR_STATE = _enum("SENSOR_STATE", """
         VALID_DATA,
         NOT_CONFIGURED,
         CONFIGURING,
@@ -155,14 +149,14 @@ class BrickPi3():
         I2C_ERROR,
     """)
 
-    SENSOR_CUSTOM = Enumeration("""
-        PIN1_9V,
-        PIN5_OUT,
-        PIN5_STATE,
-        PIN6_OUT,
-        PIN6_STATE,
-        PIN1_ADC,
-        PIN6_ADC,
+    SENSOR_CUSTOM = _enum("SENSOR_CUSTOM", """
+        PIN1_9V = 0x0002,
+        PIN5_OUT = 0x0010,
+        PIN5_STATE = 0x0020,
+        PIN6_OUT = 0x0100,
+        PIN6_STATE = 0x0200,
+        PIN1_ADC = 0x1000,
+        PIN6_ADC = 0x4000,
     """)
     """
     Flags for use with SENSOR_TYPE.CUSTOM
@@ -191,38 +185,24 @@ class BrickPi3():
         Enable the analog/digital converter on pin 6.
     """
 
-    SENSOR_CUSTOM.PIN1_9V = 0x0002
-    SENSOR_CUSTOM.PIN5_OUT = 0x0010
-    SENSOR_CUSTOM.PIN5_STATE = 0x0020
-    SENSOR_CUSTOM.PIN6_OUT = 0x0100
-    SENSOR_CUSTOM.PIN6_STATE = 0x0200
-    SENSOR_CUSTOM.PIN1_ADC = 0x1000
-    SENSOR_CUSTOM.PIN6_ADC = 0x4000
-
-    SENSOR_I2C_SETTINGS = Enumeration("""
-        MID_CLOCK,
-        PIN1_9V,
-        SAME,
-        ALLOW_STRETCH_ACK,
-        ALLOW_STRETCH_ANY,
+    # MID_CLOCK: send the clock pulse between reading and writing. Required by the NXT US sensor.
+    # PIN1_9V: 9v pullup on pin 1
+    # SAME: keep performing the same transaction e.g. keep polling a sensor
+    SENSOR_I2C_SETTINGS = _enum("SENSOR_I2C_SETTINGS", """
+        MID_CLOCK = 0x01,
+        PIN1_9V = 0x02,
+        SAME = 0x04,
+        ALLOW_STRETCH_ACK = 3,
+        ALLOW_STRETCH_ANY = 4,
     """)
 
-    # Send the clock pulse between reading and writing. Required by the NXT US sensor.
-    SENSOR_I2C_SETTINGS.MID_CLOCK = 0x01
-    SENSOR_I2C_SETTINGS.PIN1_9V = 0x02  # 9v pullup on pin 1
-    # Keep performing the same transaction e.g. keep polling a sensor
-    SENSOR_I2C_SETTINGS.SAME = 0x04
-
-    MOTOR_STATUS_FLAG = Enumeration("""
-        LOW_VOLTAGE_FLOAT,
-        OVERLOADED,
+    # LOW_VOLTAGE_FLOAT: if the motors are floating due to low battery voltage
+    # OVERLOADED: if the motors aren't close to the target (applies to position control and dps speed control).
+    MOTOR_STATUS_FLAG = _enum("MOTOR_STATUS_FLAG", """
+        LOW_VOLTAGE_FLOAT = 0x01,
+        OVERLOADED = 0x02,
     """)
 
-    # If the motors are floating due to low battery voltage
-    MOTOR_STATUS_FLAG.LOW_VOLTAGE_FLOAT = 0x01
-    # If the motors aren't close to the target (applies to position control and dps speed control).
-    MOTOR_STATUS_FLAG.OVERLOADED = 0x02
-
     #SUCCESS = 0
     #SPI_ERROR = 1
     #SENSOR_ERROR = 2
@@ -1,3 +1,5 @@
+from array import array
+import re
 import time
 
 LOOP_INTERVAL = 0.500
@@ -8,17 +10,34 @@ GRID_CELLS = GRID_COLUMNS * GRID_ROWS
 MAXIMUM_CUBES = 15
 GRID_CELL_SIZE = 4  # cm
 
+# compiled once; matching runs as a simple DFA in C with no per-character Python work
+_VALID_RE = re.compile(r"\A[01]*\Z")
+
+_TOP = "̲ " * 16
+_BOTTOM = "‾" * 16
+_FILLED = "██|"
+_EMPTY = "  |"
+
 
 class CubeGrid:
+    # fixed attribute set: drops the per-instance __dict__ and speeds up attribute access
+    __slots__ = ('valid_binary_input', 'ones', 'grid',
+                 '__column_sets', '__cube_columns', '__cube_rows')
 
     def __init__(self, user_input):
-        self.valid_binary_input = self.__validate_binary_user_input(user_input)
+        self.valid_binary_input, self.ones = self.__validate_binary_user_input(user_input)
         self.grid = self.__process_grid()
+        self.__column_sets = {column: frozenset(rows) for column, rows in self.grid.items()}
+        # parallel column/row arrays so iteration is a plain zip with no dict lookups
+        self.__cube_columns = array('B')
+        self.__cube_rows = array('B')
+        for column, rows in self.grid.items():
+            for row in rows:
+                self.__cube_columns.append(column)
+                self.__cube_rows.append(row)
 
     def __iter__(self):
-        for cube_column in self.grid:
-            for cube_row in self.get_cubes_in_column(cube_column):
-                yield cube_column, cube_row
+        return zip(self.__cube_columns, self.__cube_rows)
 
     def get_cubes_in_column(self, cube_column):
         return self.grid.get(cube_column)
@@ -32,36 +51,30 @@ class CubeGrid:
         if len(user_input) > GRID_CELLS:
             raise Exception(
                 f'Input string is invalid, maximum length of {GRID_CELLS} exceeded ({len(user_input)} entered in total)')
-        if any([character not in "01" for character in user_input]):
+        if not _VALID_RE.match(user_input):
             raise Exception('Input string is invalid, only "1"s and "0"s are allowed')
-        if user_input.count("1") > MAXIMUM_CUBES:
+        ones = user_input.count("1")
+        if ones > MAXIMUM_CUBES:
             raise Exception(
-                f'Input string is invalid, maximum of {MAXIMUM_CUBES} "1"s exceeded ({user_input.count("1")} entered in total)')
-        return user_input.ljust(GRID_CELLS, '0')
+                f'Input string is invalid, maximum of {MAXIMUM_CUBES} "1"s exceeded ({ones} entered in total)')
+        return user_input.ljust(GRID_CELLS, '0'), ones
 
     def __process_grid(self):
-        grid = {k: [] for k in iter(range(1, GRID_COLUMNS + 1))}
-        for index, bit in enumerate(self.valid_binary_input):
-            if bit == "1":
-                column = (index % GRID_COLUMNS) + 1
-                row = GRID_ROWS - (index // GRID_ROWS)
-                row_list = grid.get(column)
-                row_list.append(row)
-                grid[column] = row_list
+        grid = {k: [] for k in range(1, GRID_COLUMNS + 1)}
+        # scan the set bits of the input as one integer instead of looping over 25 characters
+        bits = int(self.valid_binary_input, 2)
+        while bits:
+            length = bits.bit_length()
+            index = GRID_CELLS - length
+            grid[(index % GRID_COLUMNS) + 1].append(GRID_ROWS - (index // GRID_ROWS))
+            bits ^= 1 << (length - 1)
         return grid
 
     def preview_grid(self):
-        output = "\u0332 "*16 + "\n"
-        for row in range(GRID_ROWS, 0, -1):
-            output += "|"
-            for column in self.grid:
-                if row in self.get_cubes_in_column(column):
-                    output += "\u2588\u2588|"
-                else:
-                    output += "  |"
-            output += "\n"
-        output += "\u203E"*16
-        print(output)
+        rows = ["|" + "".join(_FILLED if row in self.__column_sets[column] else _EMPTY
+                              for column in self.grid)
+                for row in range(GRID_ROWS, 0, -1)]
+        print(_TOP, *rows, _BOTTOM, sep="\n")
 
 
 def get_keyboard_binary_user_input():
@@ -77,7 +90,7 @@ if __name__ == "__main__":
                 keyboard_input = get_keyboard_binary_user_input()
                 cube_grid = CubeGrid(keyboard_input)
                 print(
-                    f'{cube_grid.valid_binary_input} ({cube_grid.valid_binary_input.count("1")} cubes required)')
+                    f'{cube_grid.valid_binary_input} ({cube_grid.ones} cubes required)')
                 print(cube_grid.grid)
                 cube_grid.preview_grid()
                 for cube in cube_grid:
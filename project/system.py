@@ -7,7 +7,7 @@ import threading
 DEBUG = False
 
 LOOP_INTERVAL = 0.050  # sec
-SLEEP = 0.5  # sec
+POLL_INTERVAL = 0.020  # sec, touch-read cadence: still debounce-safe but registers presses faster
 
 PUSH_CUBE_SPEED = 360  # dps
 LOAD_CUBE_SPEED = 120  # dps
@@ -20,6 +20,30 @@ MAXIMUM_CUBES = 15
 GRID_CELL_SIZE = 4  # cm
 INITIAL_PUSHER_OFFSET = 1.5  # cm
 
+# deletes every valid character, so anything left over is invalid
+_NON_BINARY_TRANS = str.maketrans("", "", "01")
+
+# the grid shape is fixed, so decode each input index to its (column, row) once at import
+_CELL_TO_COL_ROW = tuple(((index % GRID_COLUMNS) + 1, GRID_ROWS - (index // GRID_ROWS))
+                         for index in range(GRID_CELLS))
+
+# built once at import; input() already returns a str, so no str() wrapper is needed at the call site
+_PROMPT = f'Enter a string of "1"s and "0"s maximum length {GRID_CELLS}, containing a maximum of {MAXIMUM_CUBES} "1"s:\n'
+
+# bitmap mask covering all five cells of each column, for cheap column-emptiness tests
+_COLUMN_MASKS = tuple(sum(1 << index for index in range(column, GRID_CELLS, GRID_COLUMNS))
+                      for column in range(GRID_COLUMNS))
+
+# wheel radii are fixed, so fold the 360 / (2 * pi * radius) conversion into one factor per mechanism
+_MOVEMENT_ANGLE_PER_CM = 360 / (2 * math.pi * 2.00)
+_PUSHER_ANGLE_PER_CM = 360 / (2 * math.pi * 2.05)
+
+# fixed pieces of the grid preview, built once instead of re-concatenated per call
+_PREVIEW_TOP = "_" * 16
+_PREVIEW_BOTTOM = "‾" * 16
+_FILLED_CELL = "██|"
+_EMPTY_CELL = "  |"
+
 # Creating the 3 different to be played at each input.
 # Each sound will confirm to the user whether they input '1' or '0' or 'complete', or if the input is invalid.
 SOUND_1 = sound.Sound(duration=0.3, pitch="G6", volume=50)
@@ -27,17 +51,10 @@ SOUND_0 = sound.Sound(duration=0.3, pitch="C6", volume=50)
 SOUND_COMPLETE = sound.Sound(duration=0.3, pitch="D6", volume=50)
 SOUND_INVALID = sound.Sound(duration=0.3, pitch="G5", volume=50)
 
-# Creating the 3 different touch sensors for the two possible inputs '1' and '0' 'Complete'
-TOUCH_SENSOR_1 = TouchSensor(4)
-TOUCH_SENSOR_0 = TouchSensor(3)
-TOUCH_SENSOR_COMPLETE = TouchSensor(2)
-
-# Creating the 3 different motors
-ROBOT_MOVEMENT_MOTOR_1 = Motor("B")
-ROBOT_MOVEMENT_MOTOR_2 = Motor("C")
-PUSHER_MOTOR = Motor("D")
-
-wait_ready_sensors()
+def _play_and_wait(confirmation_sound):
+    """Play the given sound and block until it finishes."""
+    confirmation_sound.play()
+    confirmation_sound.wait_done()
 
 
 class GridInputValidationError(Exception):
@@ -50,53 +67,45 @@ class GridInputValidationError(Exception):
 class CubeGrid:
     def __init__(self, user_input):
         """This class represents the cube grid that the robot needs to produce."""
-        self.valid_binary_input = self.__validate_binary_user_input(user_input)
-        self.grid = self.__process_grid()
+        self.valid_binary_input, self.ones_count = self.__validate_binary_user_input(user_input)
+        self.bitmap = self.__process_grid()
+        self.nonempty_columns = tuple(column for column in range(1, GRID_COLUMNS + 1)
+                                      if self.bitmap & _COLUMN_MASKS[column - 1])
 
     def get_cubes_in_column(self, column):
         """This method returns a list of cubes to be placed in the given column."""
-        return self.grid.get(column)
+        return [_CELL_TO_COL_ROW[index][1]
+                for index in range(column - 1, GRID_CELLS, GRID_COLUMNS)
+                if self.bitmap >> index & 1]
 
     @staticmethod
     def __validate_binary_user_input(user_input):
         """This private method validates the binary input string and pads it with 0s if it is shorter than the
-        required grid. An exception is raised if the input is invalid."""
+        required grid. The padded string is returned together with its count of "1"s, so callers do not rescan
+        the string. An exception is raised if the input is invalid."""
         if len(user_input) > GRID_CELLS:
             raise GridInputValidationError(
                 f'Input string is invalid, maximum length of {GRID_CELLS} exceeded ({len(user_input)} entered in total)')
-        if any([character not in "01" for character in user_input]):
+        if user_input.translate(_NON_BINARY_TRANS):
             raise GridInputValidationError('Input string is invalid, only "1"s and "0"s are allowed')
-        if user_input.count("1") > MAXIMUM_CUBES:
+        ones = user_input.count("1")
+        if ones > MAXIMUM_CUBES:
             raise GridInputValidationError(
-                f'Input string is invalid, maximum of {MAXIMUM_CUBES} "1"s exceeded ({user_input.count("1")} entered in total)')
-        return user_input.ljust(GRID_CELLS, '0')
+                f'Input string is invalid, maximum of {MAXIMUM_CUBES} "1"s exceeded ({ones} entered in total)')
+        return user_input.ljust(GRID_CELLS, '0'), ones
 
     def __process_grid(self):
-        """This private method uses the validated binary input string and processes it into a dictionary, with each key corresponding to a grid
-        column. The value associated to each key represents a list of rows of cubes to be placed in the column."""
-        grid = {k: [] for k in iter(range(1, GRID_COLUMNS + 1))}
-        for index, bit in enumerate(self.valid_binary_input):
-            if bit == "1":
-                column = (index % GRID_COLUMNS) + 1
-                row = GRID_ROWS - (index // GRID_ROWS)
-                row_list = grid.get(column)
-                row_list.append(row)
-                grid[column] = row_list
-        return grid
+        """This private method packs the validated binary input string into a single integer bitmap, where bit i
+        indicates the presence of a cube in grid cell i. Presence tests become one shift-and-mask on one int."""
+        return int(self.valid_binary_input[::-1], 2)
 
     def preview_grid(self):
         """This method allows for a preview of the cubes on the grid to be printed to the terminal."""
-        output = "_" * 16 + "\n"
-        for row in range(GRID_ROWS, 0, -1):
-            output += "|"
-            for column in self.grid:
-                if row in self.get_cubes_in_column(column):
-                    output += "\u2588\u2588|"
-                else:
-                    output += "  |"
-            output += "\n"
-        output += "\u203E" * 16
-        print(output)
+        rows = ["|" + "".join(
+            _FILLED_CELL if self.bitmap >> (GRID_ROWS - row) * GRID_COLUMNS + (column - 1) & 1 else _EMPTY_CELL
+            for column in range(1, GRID_COLUMNS + 1))
+            for row in range(GRID_ROWS, 0, -1)]
+        print(_PREVIEW_TOP, *rows, _PREVIEW_BOTTOM, sep="\n")
 
 
 class UserInput:
@@ -110,17 +119,23 @@ class UserInput:
         self.is_using_touch_sensor_input = False
 
     def get_binary_user_input(self):
-        """This method is used to get binary user input from both the keyboard and the touch sensors at the same time using threading."""
-        keyboard_input_thread = threading.Thread(target=self.__get_keyboard_binary_user_input, daemon=True)
-        keyboard_input_thread.start()
+        """This method is used to get binary user input from both the keyboard and the touch sensors at the same time using threading.
+        The touch sensors are probed briefly first, so the keyboard thread is only spawned when it may actually be used."""
+        for _ in range(5):
+            if self.ts_0.is_pressed() or self.ts_1.is_pressed() or self.ts_complete.is_pressed():
+                self.is_using_touch_sensor_input = True
+                break
+            time.sleep(POLL_INTERVAL)
+        if not self.is_using_touch_sensor_input:
+            keyboard_input_thread = threading.Thread(target=self.__get_keyboard_binary_user_input, daemon=True)
+            keyboard_input_thread.start()
         self.__get_touch_sensor_binary_user_input()
         return self.raw_user_input
 
     def __get_keyboard_binary_user_input(self):
         """This private method is used to get binary user input from the terminal. If a touch sensor is pressed before this input is entered,
         the touch sensor input is used instead. """
-        user_input = str(input(
-            f'Enter a string of "1"s and "0"s maximum length {GRID_CELLS}, containing a maximum of {MAXIMUM_CUBES} "1"s:\n'))
+        user_input = input(_PROMPT)
         if not self.is_using_touch_sensor_input:
             self.raw_user_input = user_input.replace(" ", "")
             self.is_input_complete = True
@@ -128,33 +143,43 @@ class UserInput:
     @staticmethod
     def __wait_until_touch_sensor_released(touch_sensor):
         """This private method is used to wait until a touch sensor is released until proceeding to read the following presses."""
+        # back off from 5 ms toward 50 ms while the button stays held: quick release detection
+        # for a tap, few sensor reads for a long hold
+        interval = 0.005
         while touch_sensor.is_pressed():
-            pass
+            time.sleep(interval)
+            interval = min(interval * 1.5, 0.05)
 
     def __get_touch_sensor_binary_user_input(self):
         """This private method is get the binary user input from the touch sensors."""
+        last_drawn = None
         while not self.is_input_complete:
-            time.sleep(LOOP_INTERVAL)
-            if self.ts_0.is_pressed() or self.ts_1.is_pressed() or self.ts_complete.is_pressed():
+            time.sleep(POLL_INTERVAL)
+            # read each sensor once per iteration; the branches reuse the snapshots instead of
+            # asking the same sensor again over SPI
+            pressed_0 = self.ts_0.is_pressed()
+            pressed_1 = self.ts_1.is_pressed()
+            pressed_complete = self.ts_complete.is_pressed()
+            if pressed_0 or pressed_1 or pressed_complete:
                 self.is_using_touch_sensor_input = True
-            if self.ts_1.is_pressed() and not self.ts_0.is_pressed() and not self.ts_complete.is_pressed():
+            if pressed_1 and not pressed_0 and not pressed_complete:
                 self.raw_user_input += "1"
+                # play() is non-blocking; not waiting for the sound keeps the sensors polled
                 SOUND_1.play()
                 self.__wait_until_touch_sensor_released(self.ts_1)
-                SOUND_1.wait_done()
-            if self.ts_0.is_pressed() and not self.ts_1.is_pressed() and not self.ts_complete.is_pressed():
+            elif pressed_0 and not pressed_1 and not pressed_complete:
                 self.raw_user_input += "0"
                 SOUND_0.play()
                 self.__wait_until_touch_sensor_released(self.ts_0)
-                SOUND_0.wait_done()
-            if self.is_using_touch_sensor_input:
-                print(" " * 100, end="\r", flush=True)
-                print(f"\r{self.raw_user_input}", end="\r", flush=True)
-            if self.ts_complete.is_pressed() and not self.ts_1.is_pressed() and not self.ts_0.is_pressed():
+            # only redraw when the input changed this tick; the idle loop makes no terminal writes,
+            # and the echoed string only grows so no blank-line erase is needed
+            if self.is_using_touch_sensor_input and self.raw_user_input != last_drawn:
+                last_drawn = self.raw_user_input
+                print(f"\r{last_drawn}", end="\r", flush=True)
+            if pressed_complete and not pressed_1 and not pressed_0:
                 self.is_input_complete = True
                 self.__wait_until_touch_sensor_released(self.ts_complete)
-                SOUND_COMPLETE.play()
-                SOUND_COMPLETE.wait_done()
+                _play_and_wait(SOUND_COMPLETE)
                 print()
 
 
@@ -171,30 +196,38 @@ class RobotMovement:
     @staticmethod
     def get_rotation_angle(linear_distance):
         """This method returns the rotation angle calculation for a given linear distance."""
-        radius = 2.00
-        angle = (360 * linear_distance) / (2 * math.pi * radius)
-        return angle
+        return _MOVEMENT_ANGLE_PER_CM * linear_distance
 
     def move(self, column):
         """This method moves the robot from the current column to the given column."""
+        distance = 4 * (column - self.current_column)
+        if distance == 0:
+            return
         self.motor_1.reset_encoder()
         self.motor_2.reset_encoder()
-        distance = 4 * (column - self.current_column)
         rotation_angle = self.get_rotation_angle(distance)
         self.motor_1.set_position_relative(rotation_angle)
         self.motor_2.set_position_relative(rotation_angle)
-        time.sleep(((1 / ROBOT_MOVEMENT_SPEED) * rotation_angle) + SLEEP)
+        # wait for the actual motion instead of sleeping an estimated duration plus padding;
+        # polling both motors together returns as soon as the later one stops
+        self.motor_1.wait_is_moving()
+        while self.motor_1.is_moving() or self.motor_2.is_moving():
+            time.sleep(0.01)
         self.current_column = column
 
     def return_to_initial(self):
         """This method moves the robot back to it's initial position."""
+        distance = 4 * (self.current_column - self.initial_column)
+        if distance == 0:
+            return
         self.motor_1.reset_encoder()
         self.motor_2.reset_encoder()
-        distance = 4 * (self.current_column - self.initial_column)
         rotation_angle = self.get_rotation_angle(distance)
         self.motor_1.set_position_relative(-rotation_angle)
         self.motor_2.set_position_relative(-rotation_angle)
-        time.sleep(((1 / ROBOT_MOVEMENT_SPEED) * rotation_angle) + SLEEP)
+        self.motor_1.wait_is_moving()
+        while self.motor_1.is_moving() or self.motor_2.is_moving():
+            time.sleep(0.01)
         self.current_column = self.initial_column
 
 
@@ -207,9 +240,7 @@ class Pusher:
     @staticmethod
     def get_rotation_angle(linear_distance):
         """This method returns the rotation angle calculation for a given linear distance."""
-        radius = 2.05
-        angle = (360 * linear_distance) / (2 * math.pi * radius)
-        return angle
+        return _PUSHER_ANGLE_PER_CM * linear_distance
 
     def push_cube(self, row):
         """This method pushes a cube to the given row."""
@@ -218,9 +249,13 @@ class Pusher:
         distance = 4 * row
         rotation_angle = self.get_rotation_angle(distance)
         self.motor.set_position_relative(-rotation_angle)
-        time.sleep(((1 / PUSH_CUBE_SPEED) * rotation_angle) + SLEEP)
+        # retract as soon as the forward stroke actually stops instead of padding each
+        # stroke with half a second of settling time
+        self.motor.wait_is_moving()
+        self.motor.wait_is_stopped()
         self.motor.set_position_relative(rotation_angle)
-        time.sleep(((1 / PUSH_CUBE_SPEED) * rotation_angle) + SLEEP)
+        self.motor.wait_is_moving()
+        self.motor.wait_is_stopped()
 
     def load_cube(self):
         """This method loads a cube into the pushing mechanism."""
@@ -231,34 +266,47 @@ class Pusher:
         load_rotation_angle = self.get_rotation_angle(load_distance)
         ready_to_push_rotation_angle = self.get_rotation_angle(ready_to_push_distance)
         self.motor.set_position_relative(load_rotation_angle)
-        time.sleep(((1 / LOAD_CUBE_SPEED) * load_rotation_angle) + SLEEP)
+        self.motor.wait_is_moving()
+        self.motor.wait_is_stopped()
         self.motor.set_position_relative(-ready_to_push_rotation_angle)
-        time.sleep(((1 / LOAD_CUBE_SPEED) * ready_to_push_rotation_angle) + SLEEP)
+        self.motor.wait_is_moving()
+        self.motor.wait_is_stopped()
 
 
 if __name__ == "__main__":
+    # hardware is only claimed when running as the entry point, so importing this module
+    # (e.g. from a test script) does not open sensor ports or block in wait_ready_sensors
+
+    # Creating the 3 different touch sensors for the two possible inputs '1' and '0' 'Complete'
+    TOUCH_SENSOR_1 = TouchSensor(4)
+    TOUCH_SENSOR_0 = TouchSensor(3)
+    TOUCH_SENSOR_COMPLETE = TouchSensor(2)
+
+    # Creating the 3 different motors
+    ROBOT_MOVEMENT_MOTOR_1 = Motor("B")
+    ROBOT_MOVEMENT_MOTOR_2 = Motor("C")
+    PUSHER_MOTOR = Motor("D")
+
+    wait_ready_sensors()
+
     try:
         input_string = UserInput(TOUCH_SENSOR_1, TOUCH_SENSOR_0, TOUCH_SENSOR_COMPLETE).get_binary_user_input()
         try:
             cube_grid = CubeGrid(input_string)
         except GridInputValidationError as e:
-            SOUND_INVALID.play()
-            SOUND_INVALID.wait_done()
-            SOUND_INVALID.play()
-            SOUND_INVALID.wait_done()
+            for _ in range(2):
+                _play_and_wait(SOUND_INVALID)
             print(e)
         else:
-            print(f'{cube_grid.valid_binary_input} ({cube_grid.valid_binary_input.count("1")} cubes required)')
-            print(cube_grid.grid)
+            print(f'{cube_grid.valid_binary_input} ({cube_grid.ones_count} cubes required)')
             cube_grid.preview_grid()
 
             robot_movement = RobotMovement(ROBOT_MOVEMENT_MOTOR_1, ROBOT_MOVEMENT_MOTOR_2)
             pusher = Pusher(PUSHER_MOTOR)
-            for cube_column in cube_grid.grid:
+            for cube_column in cube_grid.nonempty_columns:
                 if DEBUG:
                     print(f"moving to column {cube_column}")
-                if cube_grid.get_cubes_in_column(cube_column):
-                    robot_movement.move(cube_column)
+                robot_movement.move(cube_column)
                 for cube_row in cube_grid.get_cubes_in_column(cube_column):
                     if DEBUG:
                         print("loading cube")
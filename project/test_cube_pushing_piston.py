@@ -11,18 +11,22 @@ LOOP_INTERVAL = 0.050
 class Pushing_piston:
     # Initialization of the motor
 
+    MAX_ROW = 5
+    RADIUS = 1.95  # cm
+
     def __init__(self, motor: Motor):
         self.motor = motor
         self.motor.set_limits(dps=180)
+        # the radius is fixed, so fold 360 / (2 * pi * radius) into one factor up front
+        self._deg_per_cm = 360 / (2 * math.pi * self.RADIUS)
+        # precompute the rotation angle for every row, so push() is a table lookup
+        self.push_angles = [self.get_rotation_angle(4 * row - 0.5) for row in range(self.MAX_ROW + 1)]
 
     def get_rotation_angle(self, linear_distance):
-        radius = 1.95
-        angle = (360 * linear_distance) / (2 * math.pi * radius)
-        return angle
+        return linear_distance * self._deg_per_cm
 
     def push(self, row):
-        distance = 4 * row - 0.5
-        rotation_angle = self.get_rotation_angle(distance)
+        rotation_angle = self.push_angles[row]
         self.motor.set_position_relative(-rotation_angle)
         self.motor.wait_is_moving()
         self.motor.wait_is_stopped()
@@ -5,6 +5,11 @@ from utils.brick import Motor, reset_brick
 
 LOOP_INTERVAL = 0.050
 
+GRID_COLUMNS = 5
+
+# the wheel radius is fixed, so fold 360 / (2 * pi * radius) into one factor at import
+_DEG_PER_CM = 360 / (2 * math.pi * 1.95)
+
 
 class RobotMovement:
     # Initialization of the motor
@@ -14,25 +19,25 @@ class RobotMovement:
         self.motor = motor
         self.motor.set_limits(dps=90)
         self.current_column = self.initial_column
+        # relative rotation for every (from, to) column pair, tabulated once so move()
+        # does no arithmetic at all
+        self.delta_angles = [[self.get_rotation_angle(4 * (to_column - from_column))
+                              for to_column in range(GRID_COLUMNS + 1)]
+                             for from_column in range(GRID_COLUMNS + 1)]
 
     @staticmethod
     def get_rotation_angle(linear_distance):
-        radius = 1.95
-        angle = (360 * linear_distance) / (2 * math.pi * radius)
-        return angle
+        return linear_distance * _DEG_PER_CM
 
     def move(self, column):
-        distance = 4 * (column - self.current_column)
-        self.motor.set_position_relative(self.get_rotation_angle(distance))
-        self.motor.wait_is_moving()
-        self.motor.wait_is_stopped()
+        self.motor.set_position_relative(self.delta_angles[self.current_column][column])
+        self.motor.wait_until_not_moving()
         self.current_column = column
 
     def return_to_initial(self):
         distance = 4 * self.current_column - 0.5
         self.motor.set_position_relative(-self.get_rotation_angle(distance))
-        self.motor.wait_is_moving()
-        self.motor.wait_is_stopped()
+        self.motor.wait_until_not_moving()
         self.current_column = self.initial_column
 
 
@@ -1,7 +1,8 @@
 from utils.brick import Motor, TouchSensor, reset_brick, wait_ready_sensors
 from utils import sound
+import select
+import sys
 import time
-import threading
 
 LOOP_INTERVAL = 0.050
 
@@ -13,6 +14,15 @@ GRID_CELLS = GRID_COLUMNS * GRID_ROWS
 MAXIMUM_CUBES = 15
 GRID_CELL_SIZE = 4  # cm
 
+# column keys are fixed, so build the range once at import
+_COLUMN_KEYS = tuple(range(1, GRID_COLUMNS + 1))
+
+# fixed pieces of the grid preview, built once instead of re-concatenated per call
+_PREVIEW_TOP = "_" * 16
+_PREVIEW_BOTTOM = "‾" * 16
+_FILLED_CELL = "██|"
+_EMPTY_CELL = "  |"
+
 # Creating the 3 different to be played at each input.
 # each sound will confirm to the user whether they input '1' or '0' or 'complete'
 SOUND_1 = sound.Sound(duration=1, pitch="G6", volume=50)
@@ -35,8 +45,9 @@ class CubeGrid:
         self.grid = self.__process_grid()
 
     def __iter__(self):
-        for cube_column in self.grid:
-            for cube_row in self.get_cubes_in_column(cube_column):
+        # items() yields each column's list directly, avoiding a second dict lookup per column
+        for cube_column, cube_rows in self.grid.items():
+            for cube_row in cube_rows:
                 yield cube_column, cube_row
 
     def get_cubes_in_column(self, cube_column):
@@ -51,36 +62,31 @@ class CubeGrid:
         if len(user_input) > GRID_CELLS:
             raise GridInputValidationError(
                 f'Input string is invalid, maximum length of {GRID_CELLS} exceeded ({len(user_input)} entered in total)')
-        if any([character not in "01" for character in user_input]):
+        # strip('01') leaves an empty string iff every character is valid, in one C-level pass
+        if user_input.strip("01"):
             raise GridInputValidationError('Input string is invalid, only "1"s and "0"s are allowed')
-        if user_input.count("1") > MAXIMUM_CUBES:
+        ones = user_input.count("1")
+        if ones > MAXIMUM_CUBES:
             raise GridInputValidationError(
-                f'Input string is invalid, maximum of {MAXIMUM_CUBES} "1"s exceeded ({user_input.count("1")} entered in total)')
+                f'Input string is invalid, maximum of {MAXIMUM_CUBES} "1"s exceeded ({ones} entered in total)')
         return user_input.ljust(GRID_CELLS, '0')
 
     def __process_grid(self):
-        grid = {k: [] for k in iter(range(1, GRID_COLUMNS + 1))}
+        grid = {k: [] for k in _COLUMN_KEYS}
         for index, bit in enumerate(self.valid_binary_input):
             if bit == "1":
                 column = (index % GRID_COLUMNS) + 1
                 row = GRID_ROWS - (index // GRID_ROWS)
-                row_list = grid.get(column)
-                row_list.append(row)
-                grid[column] = row_list
+                grid[column].append(row)
         return grid
 
     def preview_grid(self):
-        output = "_" * 16 + "\n"
-        for row in range(GRID_ROWS, 0, -1):
-            output += "|"
-            for column in self.grid:
-                if row in self.get_cubes_in_column(column):
-                    output += "\u2588\u2588|"
-                else:
-                    output += "  |"
-            output += "\n"
-        output += "\u203E" * 16
-        print(output)
+        # sets make the per-cell membership test O(1), and join replaces the += concatenations
+        column_sets = {column: set(rows) for column, rows in self.grid.items()}
+        rows = ["|" + "".join(_FILLED_CELL if row in column_sets[column] else _EMPTY_CELL
+                              for column in self.grid)
+                for row in range(GRID_ROWS, 0, -1)]
+        print(_PREVIEW_TOP, *rows, _PREVIEW_BOTTOM, sep="\n")
 
 
 class UserInput:
@@ -90,42 +96,56 @@ class UserInput:
         self.is_using_touch_sensor_input = False
 
     def get_binary_user_input(self):
-        keyboard_input_thread = threading.Thread(target=self.__get_keyboard_binary_user_input, daemon=True)
-        keyboard_input_thread.start()
+        print(f'Enter a string of "1"s and "0"s maximum length {GRID_CELLS}, containing a maximum of {MAXIMUM_CUBES} "1"s:')
         self.__get_touch_sensor_binary_user_input()
         return self.raw_user_input
 
-    def __get_keyboard_binary_user_input(self):
-        user_input = str(input(
-            f'Enter a string of "1"s and "0"s maximum length {GRID_CELLS}, containing a maximum of {MAXIMUM_CUBES} "1"s:\n'))
-        if not self.is_using_touch_sensor_input:
-            self.raw_user_input = user_input.replace(" ", "")
-            self.is_input_complete = True
+    def __check_keyboard_binary_user_input(self):
+        # select with a zero timeout reports whether a full line is waiting on stdin,
+        # so keyboard input is folded into the touch poll loop without a second thread
+        if select.select([sys.stdin], [], [], 0)[0]:
+            user_input = sys.stdin.readline().rstrip("\n")
+            if not self.is_using_touch_sensor_input:
+                self.raw_user_input = user_input.replace(" ", "")
+                self.is_input_complete = True
 
     @staticmethod
     def __wait_until_touch_sensor_released(touch_sensor):
+        # back off from 5 ms toward 50 ms while the button stays held
+        interval = 0.005
         while touch_sensor.is_pressed():
-            pass
+            time.sleep(interval)
+            interval = min(interval * 1.5, 0.05)
 
     def __get_touch_sensor_binary_user_input(self):
+        last_drawn = None
         while not self.is_input_complete:
             time.sleep(LOOP_INTERVAL)
-            if TS_0.is_pressed() or TS_1.is_pressed() or TS_COMPLETE.is_pressed():
+            self.__check_keyboard_binary_user_input()
+            if self.is_input_complete:
+                break
+            # read each sensor once per iteration; the branches reuse the snapshots
+            pressed_0 = TS_0.is_pressed()
+            pressed_1 = TS_1.is_pressed()
+            pressed_complete = TS_COMPLETE.is_pressed()
+            if pressed_0 or pressed_1 or pressed_complete:
                 self.is_using_touch_sensor_input = True
-            if TS_1.is_pressed() and not TS_0.is_pressed() and not TS_COMPLETE.is_pressed():
+            if pressed_1 and not pressed_0 and not pressed_complete:
                 self.raw_user_input += "1"
                 SOUND_1.play()
                 self.__wait_until_touch_sensor_released(TS_1)
                 SOUND_1.wait_done()
-            if TS_0.is_pressed() and not TS_1.is_pressed() and not TS_COMPLETE.is_pressed():
+            if pressed_0 and not pressed_1 and not pressed_complete:
                 self.raw_user_input += "0"
                 SOUND_0.play()
                 self.__wait_until_touch_sensor_released(TS_0)
                 SOUND_0.wait_done()
-            if self.is_using_touch_sensor_input:
-                print(" " * 100, end="\r", flush=True)
-                print(f"\r{self.raw_user_input}", end="\r", flush=True)
-            if TS_COMPLETE.is_pressed() and not TS_1.is_pressed() and not TS_0.is_pressed():
+            # only redraw when the input changed this tick; the idle loop makes no terminal writes,
+            # and the echoed string only grows so no blank-line erase is needed
+            if self.is_using_touch_sensor_input and self.raw_user_input != last_drawn:
+                last_drawn = self.raw_user_input
+                print(f"\r{last_drawn}", end="\r", flush=True)
+            if pressed_complete and not pressed_1 and not pressed_0:
                 self.is_input_complete = True
                 self.__wait_until_touch_sensor_released(TS_COMPLETE)
                 SOUND_COMPLETE.play()
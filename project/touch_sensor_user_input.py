@@ -10,6 +10,8 @@ from utils.brick import TouchSensor, wait_ready_sensors
 
 import time
 
+POLL_INTERVAL = 0.010  # sec between sensor reads
+
 # Creating the 2 different to be played at each input.
 # each sound will confirm to the user whether they input '1' or '0'
 SOUND_1_ = sound.Sound(duration=1, pitch="G6", volume=50)
@@ -21,21 +23,55 @@ TOUCH_SENSOR_ready_ = TouchSensor(3)
 
 input_max = 25  # this will be the maximum input expected according to our grid size
 
+# number of consecutive released reads needed before a button counts as released,
+# so switch bounce on release cannot register a second press
+RELEASE_STABLE_READS = 2
+
 
 def get_touch_sensor_binary_user_input():
     input_counter = 0  # This will be a counter that will check how many times did the user input with the sensors
     user_input_sense = ""
-    while input_counter < input_max and not TOUCH_SENSOR_ready_.is_pressed():
-        if TOUCH_SENSOR_1_.is_pressed() and not TOUCH_SENSOR_0_.is_pressed():
-            user_input_sense += "1"
-            input_counter += 1
-            SOUND_1_.play()
-            SOUND_1_.wait_done()
-        if TOUCH_SENSOR_0_.is_pressed() and not TOUCH_SENSOR_1_.is_pressed():
-            user_input_sense += "0"
-            input_counter += 1
-            SOUND_0_.play()
-            SOUND_0_.wait_done()
+    # hoist the bound methods and globals so the loop resolves each attribute chain once
+    is_pressed_1 = TOUCH_SENSOR_1_.is_pressed
+    is_pressed_0 = TOUCH_SENSOR_0_.is_pressed
+    is_pressed_ready = TOUCH_SENSOR_ready_.is_pressed
+    sound_1 = SOUND_1_
+    sound_0 = SOUND_0_
+    max_inputs = input_max
+    held_1 = held_0 = False
+    released_reads_1 = released_reads_0 = 0
+    while input_counter < max_inputs and not is_pressed_ready():
+        # read each sensor once per iteration and pack both into a bitmask;
+        # a non-zero power of two means exactly one button is down
+        pressed_1 = is_pressed_1()
+        pressed_0 = is_pressed_0()
+        mask = pressed_1 | pressed_0 << 1
+        if mask and not mask & (mask - 1):
+            # a press registers immediately on its rising edge
+            # play() is non-blocking, so the next press is visible while the tone still sounds
+            if mask == 1 and not held_1:
+                user_input_sense += "1"
+                input_counter += 1
+                sound_1.play()
+            elif mask == 2 and not held_0:
+                user_input_sense += "0"
+                input_counter += 1
+                sound_0.play()
+        # the release is debounced: only count a button as released after
+        # RELEASE_STABLE_READS consecutive released reads
+        if pressed_1:
+            held_1, released_reads_1 = True, 0
+        else:
+            released_reads_1 += 1
+            if released_reads_1 >= RELEASE_STABLE_READS:
+                held_1 = False
+        if pressed_0:
+            held_0, released_reads_0 = True, 0
+        else:
+            released_reads_0 += 1
+            if released_reads_0 >= RELEASE_STABLE_READS:
+                held_0 = False
+        time.sleep(POLL_INTERVAL)
     return user_input_sense
 
 
@@ -10,6 +10,9 @@ GRID_CELLS = GRID_COLUMNS * GRID_ROWS
 MAXIMUM_CUBES = 15
 GRID_CELL_SIZE = 4  # cm
 
+# column keys are fixed, so build the range once at import
+_COLUMN_KEYS = tuple(range(1, GRID_COLUMNS + 1))
+
 
 class CubeGrid:
     def __init__(self, user_input):
@@ -17,8 +20,9 @@ class CubeGrid:
         self.grid = self.__process_grid()
 
     def __iter__(self):
-        for cube_column in self.grid:
-            for cube_row in self.get_cubes_in_column(cube_column):
+        # items() yields each column's list directly, avoiding a second dict lookup per column
+        for cube_column, cube_rows in self.grid.items():
+            for cube_row in cube_rows:
                 yield cube_column, cube_row
 
     def get_cubes_in_column(self, cube_column):
@@ -33,36 +37,32 @@ class CubeGrid:
         if len(user_input) > GRID_CELLS:
             raise Exception(
                 f'Input string is invalid, maximum length of {GRID_CELLS} exceeded ({len(user_input)} entered in total)')
-        if any([character not in "01" for character in user_input]):
+        # strip('01') leaves an empty string iff every character is valid, in one C-level pass
+        if user_input.strip("01"):
             raise Exception('Input string is invalid, only "1"s and "0"s are allowed')
-        if user_input.count("1") > MAXIMUM_CUBES:
+        ones = user_input.count("1")
+        if ones > MAXIMUM_CUBES:
             raise Exception(
-                f'Input string is invalid, maximum of {MAXIMUM_CUBES} "1"s exceeded ({user_input.count("1")} entered in total)')
+                f'Input string is invalid, maximum of {MAXIMUM_CUBES} "1"s exceeded ({ones} entered in total)')
         return user_input.ljust(GRID_CELLS, '0')
 
     def __process_grid(self):
-        grid = {k: [] for k in iter(range(1, GRID_COLUMNS + 1))}
-        for index, bit in enumerate(self.valid_binary_input):
-            if bit == "1":
-                column = (index % GRID_COLUMNS) + 1
-                row = GRID_ROWS - (index // GRID_ROWS)
-                row_list = grid.get(column)
-                row_list.append(row)
-                grid[column] = row_list
+        grid = {k: [] for k in _COLUMN_KEYS}
+        # scan the set bits of the input as one integer instead of looping over 25 characters
+        bits = int(self.valid_binary_input, 2)
+        while bits:
+            length = bits.bit_length()
+            index = GRID_CELLS - length
+            grid[(index % GRID_COLUMNS) + 1].append(GRID_ROWS - (index // GRID_ROWS))
+            bits ^= 1 << (length - 1)
         return grid
 
     def preview_grid(self):
-        output = "\u0332" * 16 + "\n"
-        for row in range(GRID_ROWS, 0, -1):
-            output += "|"
-            for column in self.grid:
-                if row in self.get_cubes_in_column(column):
-                    output += "\u2588\u2588|"
-                else:
-                    output += "  |"
-            output += "\n"
-        output += "\u203E" * 16
-        print(output)
+        # sets make the per-cell membership test O(1), and join replaces the += concatenations
+        column_sets = [set(rows) for rows in self.grid.values()]
+        rows = ["|" + "".join("\u2588\u2588|" if row in rowset else "  |" for rowset in column_sets)
+                for row in range(GRID_ROWS, 0, -1)]
+        print("\u0332" * 16, *rows, "\u203E" * 16, sep="\n")
 
 
 class UserInput:
@@ -70,6 +70,8 @@ class UserInput:
         self.raw_user_input = ""
         self.is_input_complete = False
         self.is_using_touch_sensor_input = False
+        self._input_lock = threading.Lock()
+        self._complete = threading.Event()
 
     def get_binary_user_input(self):
         keyboard_input_thread = threading.Thread(target=self.__get_keyboard_binary_user_input, daemon=True)
@@ -83,25 +85,30 @@ class UserInput:
         if not self.is_using_touch_sensor_input:
             self.raw_user_input = user_input.replace(" ", "")
             self.is_input_complete = True
+            self._complete.set()
+
+    def __on_button(self, bit):
+        # callbacks run on the keyboard library's thread, so appends are serialized by the lock
+        with self._input_lock:
+            self.is_using_touch_sensor_input = True
+            self.raw_user_input += bit
+            print(f"\r{self.raw_user_input}", end="\r", flush=True)
+
+    def __on_complete(self, _event):
+        self.is_using_touch_sensor_input = True
+        self.is_input_complete = True
+        print()
+        self._complete.set()
 
     def __get_touch_sensor_binary_user_input(self):
-        while not self.is_input_complete:
-            time.sleep(LOOP_INTERVAL)
-            button_zero = keyboard.is_pressed("a")
-            button_one = keyboard.is_pressed("s")
-            button_complete = keyboard.is_pressed("d")
-            if button_zero or button_one or button_complete:
-                self.is_using_touch_sensor_input = True
-            if button_one and not button_zero and not button_complete:
-                self.raw_user_input += "1"
-            if button_zero and not button_one and not button_complete:
-                self.raw_user_input += "0"
-            if self.is_using_touch_sensor_input:
-                print(" " * 100, end="\r", flush=True)
-                print(f"\r{self.raw_user_input}", end="\r", flush=True)
-            if button_complete and not button_one and not button_zero:
-                self.is_input_complete = True
-                print()
+        # presses arrive as events instead of being polled every LOOP_INTERVAL, so a keystroke
+        # registers immediately and the main thread sleeps until the input is complete
+        hooks = [keyboard.on_press_key("s", lambda _event: self.__on_button("1")),
+                 keyboard.on_press_key("a", lambda _event: self.__on_button("0")),
+                 keyboard.on_press_key("d", self.__on_complete)]
+        self._complete.wait()
+        for hook in hooks:
+            keyboard.unhook(hook)
 
 
 if __name__ == "__main__":
@@ -391,12 +391,18 @@ class Sensor:
             time.sleep(WAIT_READY_INTERVAL)
 
 
+# sensors already waited on, so repeated wait_ready_sensors() calls (e.g. from several
+# modules importing each other) do not redo the initialization handshake
+_READY_SENSORS = set()
+
+
 def wait_ready_sensors(debug=False):
     for port, sensor in Sensor.ALL_SENSORS.items():
-        if sensor is not None:
+        if sensor is not None and sensor not in _READY_SENSORS:
             if debug:
                 print(f"Initializing Port {port}:", type(sensor).__name__)
             sensor.wait_ready()
+            _READY_SENSORS.add(sensor)
     if debug:
         print("All Sensors Initialized")
 
@@ -867,6 +873,25 @@ class Motor:
         while self.is_moving():
             time.sleep(sleep_interval)
 
+    def wait_until_not_moving(self, timeout: float = None, sleep_interval: float = None):
+        """
+        Wait until the motor has started and then stopped moving, in one call.
+        Returns as soon as the motor is no longer moving for any reason, or once
+        the optional timeout (in seconds) expires, which guards against waiting
+        forever on a motion that never starts.
+        """
+        if sleep_interval is None:
+            sleep_interval = WAIT_READY_INTERVAL
+        end_time = None if timeout is None else time.time() + timeout
+        while not self.is_moving():
+            if end_time is not None and time.time() > end_time:
+                return
+            time.sleep(sleep_interval)
+        while self.is_moving():
+            if end_time is not None and time.time() > end_time:
+                return
+            time.sleep(sleep_interval)
+
 
 def create_motors(motor_ports: list[Literal["A", "B", "C", "D"]] | str):
     return Motor.create_motors(motor_ports)